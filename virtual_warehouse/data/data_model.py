@@ -1,5 +1,7 @@
 """Data model using Owlready2 ontology."""
 import datetime
+from collections import defaultdict
+from contextlib import contextmanager
 from typing import List
 
 from owlready2 import (
@@ -12,7 +14,7 @@ from owlready2 import (
 
 from virtual_warehouse.data.utils import (
     convert_date,
-    convert_dim,
+    convert_dims,
     convert_type,
     convert_weight,
 )
@@ -21,6 +23,18 @@ from virtual_warehouse.data.utils import (
 BASE_IRI = "http://warehouse/onto.owl"
 onto = get_ontology(BASE_IRI)
 
+# In-memory indexes mapping IDs to entities (avoid SQLite lookups during parsing)
+_item_index = {}
+_location_index = {}
+_order_index = {}
+_country_index = {}
+
+# Relations between IDs used for connecting entities without SPARQL queries
+_loc_to_items = defaultdict(set)
+_item_to_locs = defaultdict(set)
+_item_to_orders = defaultdict(set)
+_order_to_items = defaultdict(set)
+
 
 def destroy_all(cls):
     """Destroy all instances of given class.
@@ -41,6 +55,73 @@ def save_ontology(file_path):
     onto.save(file_path, format="rdfxml")
 
 
+def _related_ids(ids, relation):
+    """Get set of IDs related to any of given IDs.
+
+    Args:
+        ids (Iterable[str]): IDs of source entities
+        relation (dict[str, set[str]]): relation index mapping ID to related IDs
+
+    Returns:
+        set[str]: IDs of related entities
+    """
+    related = set()
+    for i in ids:
+        related.update(relation.get(i, ()))
+    return related
+
+
+def _get_entities(ids, index):
+    """Get list of existing entities from index for given IDs."""
+    return [index[i] for i in ids if i in index]
+
+
+@contextmanager
+def batch_insert():
+    """Context manager for bulk creation of entities (e.g. parsing whole sheet).
+
+    SQLite backend runs without syncing and with in-memory journal, changes are
+    committed at once when leaving the context and query planner statistics are
+    updated for the new data.
+    """
+    db = default_world.graph.db
+    db.commit()
+    synchronous = db.execute("PRAGMA synchronous").fetchone()[0]
+    journal_mode = db.execute("PRAGMA journal_mode").fetchone()[0]
+    db.execute("PRAGMA synchronous=OFF")
+    db.execute("PRAGMA journal_mode=MEMORY")
+    try:
+        yield
+    finally:
+        db.commit()
+        db.execute("ANALYZE")
+        db.execute(f"PRAGMA synchronous={synchronous}")
+        db.execute(f"PRAGMA journal_mode={journal_mode}")
+
+
+def _tune_backend():
+    """Set SQLite pragmas and indexes of the Owlready2 backend for faster queries.
+
+    WAL journal and memory-mapped I/O take effect only for file-backed world,
+    in-memory world uses just bigger page cache and in-memory temporary storage.
+    """
+    db = default_world.graph.db
+    db.commit()
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("PRAGMA mmap_size=268435456")
+    db.execute("PRAGMA temp_store=MEMORY")
+    # Negative value is size of page cache in KiB (64 MB)
+    db.execute("PRAGMA cache_size=-65536")
+    # Covering indexes for relation lookups by predicate (quads is view over objs)
+    db.execute("CREATE INDEX IF NOT EXISTS idx_po ON objs(p, o, s)")
+    db.execute("CREATE INDEX IF NOT EXISTS idx_ps ON objs(p, s, o)")
+    db.commit()
+
+
+_tune_backend()
+
+
 with onto:
 
     class Country(Thing):
@@ -101,8 +182,12 @@ with onto:
         ):
             expiry_date = convert_date(expiry_date, "%d.%m.%Y")
 
-            item = onto.search_one(iri=f"{BASE_IRI}#{item_id}")
-            location = onto.search_one(iri=f"{BASE_IRI}#{location_id}")
+            # Indexes use string IDs (xls cells may contain numbers)
+            item = _item_index.get(str(item_id))
+            location = _location_index.get(str(location_id))
+            if item is not None and location is not None:
+                _loc_to_items[location.name].add(item.name)
+                _item_to_locs[item.name].add(location.name)
 
             return cls(
                 f"{date.strftime('%Y:%m:%d')}-{location_id}-{item_id}",
@@ -122,19 +207,8 @@ with onto:
         def destroy_all(cls):
             """Destroy all instances of Inventory class."""
             destroy_all(cls)
-
-        @staticmethod
-        def get_by_item(item, date):
-            """Get list of inventories containing item on given date.
-
-            Args:
-                item (Item): item object to look for.
-                date (datetime.datetime): date of inventory
-
-            Returns:
-                List[Item]: list of items stored at locations
-            """
-            return onto.search(type=Inventory, has_item=item)
+            _loc_to_items.clear()
+            _item_to_locs.clear()
 
     class ItemUnit(PhysicalObject):
         """Represents different packaging units of item.
@@ -162,9 +236,7 @@ with onto:
             weight: float,
             weight_uom: str,
         ):
-            length = convert_dim(length, dim_uom)
-            width = convert_dim(width, dim_uom)
-            height = convert_dim(height, dim_uom)
+            length, width, height = convert_dims((length, width, height), dim_uom)
             weight = convert_weight(weight, weight_uom)
 
             return cls(
@@ -199,7 +271,7 @@ with onto:
             base_unit: ItemUnit,
             unit_levels: List[ItemUnit],
         ):
-            return cls(
+            item = cls(
                 _id,
                 has_description=description,
                 has_gtype=gtype,
@@ -207,12 +279,20 @@ with onto:
                 has_base_unit=base_unit,
                 has_unit_levels=unit_levels,
             )
+            _item_index[str(_id)] = item
+            return item
 
         @classmethod
         def destroy_all(cls):
             """Destroy all instances of Item class as well as related entities."""
             destroy_all(cls)
             destroy_all(ItemUnit)
+            _item_index.clear()
+            # Inventory and order references to destroyed items are removed as well
+            _loc_to_items.clear()
+            _item_to_locs.clear()
+            _item_to_orders.clear()
+            _order_to_items.clear()
 
         @staticmethod
         def get_by_locations(locations):
@@ -225,13 +305,8 @@ with onto:
                 List[Item]: list of items stored at locations
             """
             # TODO: Check inventory date
-            values = " ".join(map(lambda x: f"<{x.iri}>", locations))
-            i1 = "VALUES ?loc { " + values + " } .\n"
-            i2 = f"?inv <{has_location.iri}> ?loc .\n"
-            i3 = f"?inv <{has_item.iri}> ?item .\n"
-
-            query = "SELECT DISTINCT ?item WHERE { " + i1 + i2 + i3 + " }"
-            return list(default_world.sparql_query(query))
+            ids = _related_ids((l.name for l in locations), _loc_to_items)
+            return _get_entities(ids, _item_index)
 
         @staticmethod
         def get_by_orders(orders):
@@ -243,13 +318,8 @@ with onto:
             Returns:
                 List[Item]: list of items included in orders.
             """
-            values = " ".join(map(lambda x: f"<{x.iri}>", orders))
-            i1 = "VALUES ?ord { " + values + " } .\n"
-            i2 = f"?ord <{has_ordered_items.iri}> ?oi .\n"
-            i3 = f"?oi <{has_item.iri}> ?item .\n"
-
-            query = "SELECT DISTINCT ?item WHERE { " + i1 + i2 + i3 + " }"
-            return list(default_world.sparql_query(query))
+            ids = _related_ids((o.name for o in orders), _order_to_items)
+            return _get_entities(ids, _item_index)
 
     class Location(PhysicalObject):
         """Description of location in warehouse.
@@ -289,13 +359,11 @@ with onto:
             z: float = None,
         ):
             ltype = convert_type(ltype)
-            length = convert_dim(length, dim_uom)
-            width = convert_dim(width, dim_uom)
-            height = convert_dim(height, dim_uom)
+            length, width, height = convert_dims((length, width, height), dim_uom)
             if max_weight:
                 max_weight = convert_weight(max_weight, weight_uom)
 
-            return cls(
+            location = cls(
                 _id,
                 has_ltype=ltype,
                 has_lclass=lclass,
@@ -309,6 +377,8 @@ with onto:
                 has_y=y,
                 has_z=z,
             )
+            _location_index[str(_id)] = location
+            return location
 
         def set_coord(self, x: float, y: float, z: float):
             """Additionally set coordinates of the location."""
@@ -322,6 +392,10 @@ with onto:
         def destroy_all(cls):
             """Destroy all instances of Location class."""
             destroy_all(cls)
+            _location_index.clear()
+            # Inventory references to destroyed locations are removed as well
+            _loc_to_items.clear()
+            _item_to_locs.clear()
 
     class has_ltype(Location >> str, FunctionalProperty):
         """Location type."""
@@ -359,16 +433,9 @@ with onto:
             Returns:
                 List[RackLocation]: list of locations containing ordered items
             """
-            # TODO: speed up this query (reverse property???)
-            values = " ".join(map(lambda x: f"<{x.iri}>", orders))
-            i1 = "VALUES ?ord { " + values + " } .\n"
-            i2 = f"?ord <{has_ordered_items.iri}> ?oi .\n"
-            i3 = f"?oi <{has_item.iri}> ?item .\n"
-            i4 = f"?inv <{has_item.iri}> ?item .\n"
-            i5 = f"?inv <{has_location.iri}> ?loc .\n"
-
-            query = "SELECT DISTINCT ?loc WHERE { " + i1 + i2 + i3 + i4 + i5 + " }"
-            return list(default_world.sparql_query(query))
+            item_ids = _related_ids((o.name for o in orders), _order_to_items)
+            ids = _related_ids(item_ids, _item_to_locs)
+            return _get_entities(ids, _location_index)
 
         @staticmethod
         def get_by_items(items):
@@ -380,13 +447,8 @@ with onto:
             Returns:
                 List[RackLocation]: list of locations storing items
             """
-            values = " ".join(map(lambda x: f"<{x.iri}>", items))
-            i1 = "VALUES ?item { " + values + " } .\n"
-            i2 = f"?inv <{has_item.iri}> ?item .\n"
-            i3 = f"?inv <{has_location.iri}> ?loc .\n"
-
-            query = "SELECT DISTINCT ?loc WHERE { " + i1 + i2 + i3 + " }"
-            return list(default_world.sparql_query(query))
+            ids = _related_ids((i.name for i in items), _item_to_locs)
+            return _get_entities(ids, _location_index)
 
     class OrderedItem(ItemInstance):
         """Description of item instance in order.
@@ -436,11 +498,11 @@ with onto:
             s_ship_date = convert_date(s_ship_date, "%d.%m.%Y")
             a_ship_date = convert_date(a_ship_date, "%d.%m.%Y")
 
-            country = onto.search_one(iri=f"{BASE_IRI}#{country_id}")
+            country = _country_index.get(country_id)
             if country is None:
-                country = Country(country_id)
+                country = _country_index[country_id] = Country(country_id)
 
-            item = onto.search_one(iri=f"{BASE_IRI}#{item_id}")
+            item = _item_index.get(str(item_id))
             oi = OrderedItem(
                 f"{_id}-{item_id}",
                 has_item=item,
@@ -448,8 +510,11 @@ with onto:
                 has_total_qty=total_qty,
                 has_qty_uom=qty_uom,
             )
+            if item is not None:
+                _order_to_items[_id].add(item.name)
+                _item_to_orders[item.name].add(_id)
 
-            return cls(
+            order = cls(
                 _id,
                 has_direction=direction,
                 has_country=country,
@@ -459,12 +524,14 @@ with onto:
                 has_line_num=line_num,
                 has_ordered_items=[oi],
             )
+            _order_index[_id] = order
+            return order
 
         def add_item(
             self, item_id: str, requested_qty: int, total_qty: int, qty_uom: str
         ):
             """Create and add item instance into order."""
-            item = onto.search_one(iri=f"{BASE_IRI}#{item_id}")
+            item = _item_index.get(str(item_id))
             oi = OrderedItem(
                 f"{self.name}-{item_id}",
                 has_item=item,
@@ -473,12 +540,18 @@ with onto:
                 has_qty_uom=qty_uom,
             )
             self.has_ordered_items.append(oi)
+            if item is not None:
+                _order_to_items[self.name].add(item.name)
+                _item_to_orders[item.name].add(self.name)
 
         @classmethod
         def destroy_all(cls):
             """Destroy all instances of Order class as well as related entities."""
             destroy_all(cls)
             destroy_all(OrderedItem)
+            _order_index.clear()
+            _order_to_items.clear()
+            _item_to_orders.clear()
 
         @staticmethod
         def get_by_items(items):
@@ -490,13 +563,8 @@ with onto:
             Returns:
                 List[Order]: list of orders containing at leas one of the provided items
             """
-            values = " ".join(map(lambda x: f"<{x.iri}>", items))
-            i1 = "VALUES ?item { " + values + " } .\n"
-            i2 = f"?oi <{has_item.iri}> ?item .\n"
-            i3 = f"?ord <{has_ordered_items.iri}> ?oi .\n"
-
-            query = "SELECT DISTINCT ?ord WHERE { " + i1 + i2 + i3 + " }"
-            return list(default_world.sparql_query(query))
+            ids = _related_ids((i.name for i in items), _item_to_orders)
+            return _get_entities(ids, _order_index)
 
         @staticmethod
         def get_by_locations(locations):
@@ -508,15 +576,9 @@ with onto:
             Returns:
                 List[Order]: list of orders containing items stored at given locations
             """
-            values = " ".join(map(lambda x: f"<{x.iri}>", locations))
-            i1 = "VALUES ?loc { " + values + " } .\n"
-            i2 = f"?inv <{has_location.iri}> ?loc .\n"
-            i3 = f"?inv <{has_item.iri}> ?item .\n"
-            i4 = f"?oi <{has_item.iri}> ?item .\n"
-            i5 = f"?ord <{has_ordered_items.iri}> ?oi .\n"
-
-            query = "SELECT DISTINCT ?ord WHERE { " + i1 + i2 + i3 + i4 + i5 + " }"
-            return list(default_world.sparql_query(query))
+            item_ids = _related_ids((l.name for l in locations), _loc_to_items)
+            ids = _related_ids(item_ids, _item_to_orders)
+            return _get_entities(ids, _order_index)
 
     # Order properties
     class has_direction(Order >> str, FunctionalProperty):
@@ -28,7 +28,8 @@ class Document:
         if self.is_xlsx:
             self.doc = xlsxio.XlsxioReader(file_path)
         else:
-            self.doc = open_workbook(file_path)
+            # Sheets are loaded only when parsed and unloaded afterwards
+            self.doc = open_workbook(file_path, on_demand=True)
 
     @staticmethod
     def check_xlsx(file_path):
@@ -44,12 +45,15 @@ class Document:
         else:
             doc = open_workbook(file_path, on_demand=True)
             names = doc.sheet_names()
+            doc.release_resources()
         return [[n, estimate_sheet_type(n)] for n in names]
 
     def close(self):
         """Release resources owned by the document."""
         if self.is_xlsx:
             self.doc.close()
+        else:
+            self.doc.release_resources()
 
     def parse_locations(self, sheet_name="LOCATIONmaster"):
         """Parse LOCATIONmaster sheet."""
@@ -71,16 +75,18 @@ class Document:
             sheet = self.doc.sheet_by_name(sheet_name)
 
             for row in range(1, sheet.nrows):
-                location_id = str(sheet.cell(row, 0).value)
+                values = sheet.row_values(row, 0, 11)
+                location_id = str(values[0])
                 if not location_id:
                     continue
 
-                values = [sheet.cell(row, i).value for i in range(11)]
                 if convert_type(values[1]) == "rack":
                     self.locations[location_id] = RackLocation.create(*values)
                 else:
                     self.locations[location_id] = Location.create(*values)
 
+            self.doc.unload_sheet(sheet_name)
+
         return self.locations
 
     def parse_coordinates(self, sheet_name="XYZ_coordinates"):
@@ -99,13 +105,14 @@ class Document:
             sheet = self.doc.sheet_by_name(sheet_name)
 
             for row in range(1, sheet.nrows):
-                location_id = str(sheet.cell(row, 0).value)
+                values = sheet.row_values(row, 0, 4)
+                location_id = str(values[0])
                 if not location_id:
                     continue
 
-                self.locations[location_id].set_coord(
-                    *(sheet.cell(row, i).value for i in range(1, 4))
-                )
+                self.locations[location_id].set_coord(*values[1:4])
+
+            self.doc.unload_sheet(sheet_name)
 
         return self.locations
 
@@ -142,9 +149,8 @@ class Document:
             sheet = self.doc.sheet_by_name(sheet_name)
 
             for row in range(1, sheet.nrows):
-                item_id, description, gtype, zone = (
-                    sheet.cell(row, i).value for i in range(4)
-                )
+                values = sheet.row_values(row)
+                item_id, description, gtype, zone = values[:4]
                 item_id = str(item_id)
                 if not item_id:
                     continue
@@ -152,15 +158,14 @@ class Document:
                 unit_levels = []
                 for col in range(4, sheet.ncols, 8):
                     unit_levels.append(
-                        ItemUnit.create(
-                            f"{item_id}-u{col}",
-                            *(sheet.cell(row, col + i).value for i in range(8)),
-                        )
+                        ItemUnit.create(f"{item_id}-u{col}", *values[col : col + 8])
                     )
                 self.items[item_id] = Item.create(
                     item_id, description, gtype, zone, unit_levels[0], unit_levels
                 )
 
+            self.doc.unload_sheet(sheet_name)
+
         return self.items
 
     def parse_inventory_balance(self, sheet_name="Inventory Ballance"):
@@ -184,8 +189,9 @@ class Document:
             sheet = self.doc.sheet_by_name(sheet_name)
 
             for row in range(1, sheet.nrows):
-                date = convert_date(sheet.cell(row, 0).value, "%d.%m.%Y")
-                location_id = str(sheet.cell(row, 1).value)
+                values = sheet.row_values(row, 0, 10)
+                date = convert_date(values[0], "%d.%m.%Y")
+                location_id = str(values[1])
                 if not date:
                     continue
 
@@ -195,11 +201,11 @@ class Document:
                     self.balance[date][location_id] = []
 
                 self.balance[date][location_id].append(
-                    Inventory.create(
-                        date, *(sheet.cell(row, i).value for i in range(1, 10))
-                    )
+                    Inventory.create(date, *values[1:10])
                 )
 
+            self.doc.unload_sheet(sheet_name)
+
         return self.balance
 
     def parse_orders(self, sheet_name="Order"):
@@ -222,18 +228,17 @@ class Document:
             sheet = self.doc.sheet_by_name(sheet_name)
 
             for row in range(1, sheet.nrows):
-                order_id = str(sheet.cell(row, 0).value)
+                values = sheet.row_values(row, 0, 11)
+                order_id = str(values[0])
                 if not order_id:
                     continue
 
                 if order_id in self.orders:
-                    self.orders[order_id].add_item(
-                        *(sheet.cell(row, i).value for i in range(7, 11))
-                    )
+                    self.orders[order_id].add_item(*values[7:11])
                 else:
-                    self.orders[order_id] = Order.create(
-                        *(sheet.cell(row, i).value for i in range(11))
-                    )
+                    self.orders[order_id] = Order.create(*values)
+
+            self.doc.unload_sheet(sheet_name)
 
         return self.orders
 
@@ -1,5 +1,6 @@
 """Module managing working with ontology e.g. creating queries and classes."""
 import tempfile
+from functools import lru_cache
 from multiprocessing import Process
 from subprocess import DEVNULL, check_call
 
@@ -24,6 +25,19 @@ from rdflib.plugins.sparql import prepareQuery
 
 from virtual_warehouse.data.data_model import *  # skipcq: PYL-W0614
 
+# Classes which can be used as base of custom classes and queries
+BASE_CLASSES = {"RackLocation": RackLocation, "Item": Item, "Order": Order}
+
+# Constant parts of SPARQL queries, user query is inserted in between
+_QUERY_HEAD = f"PREFIX : <{BASE_IRI}#>\nSELECT DISTINCT ?obj WHERE {{\n"
+_QUERY_TAILS = {cls: f"\n?obj a :{cls} . \n }}" for cls in BASE_CLASSES}
+
+
+@lru_cache(maxsize=128)
+def compile_condition(condition):
+    """Compile class condition expression (cached for repeated conditions)."""
+    return compile(condition, "<condition>", "eval")
+
 
 def sync(tmp_file, java_path):
     """Run reasoning on ontology."""
@@ -59,6 +73,7 @@ class OntoManager(QObject):
     objectsChanged = Signal()
     javaChanged = Signal()
     progressChanged = Signal()
+    reasoningChanged = Signal()
 
     def __init__(self):
         """Initialize OntoController."""
@@ -67,6 +82,8 @@ class OntoManager(QObject):
         owlready2.JAVA_EXE = self.settings.value("javaPath", owlready2.JAVA_EXE)
 
         self._classes = {}
+        self._pending_classes = {}
+        self._deferred_reasoning = False
         self._queries = {}
         self._check_java()
         self._thread = None
@@ -83,6 +100,24 @@ class OntoManager(QObject):
         self._progress_value = val
         self.progressChanged.emit()
 
+    @Property(bool, constant=False, notify=reasoningChanged)
+    def deferred_reasoning(self):
+        """Get true if reasoning is postponed until apply_reasoning() is called."""
+        return self._deferred_reasoning
+
+    @deferred_reasoning.setter
+    def set_deferred_reasoning(self, val):
+        """Set deferred reasoning mode, disabling it applies pending classes."""
+        self._deferred_reasoning = val
+        self.reasoningChanged.emit()
+        if not val:
+            self.apply_reasoning()
+
+    @Property(int, constant=False, notify=reasoningChanged)
+    def pending_count(self):
+        """Get number of created classes waiting for reasoning."""
+        return len(self._pending_classes)
+
     @Property(str, constant=False, notify=javaChanged)
     def java(self):  # skipcq: PYL-R0201
         """Get Java executable path for owlready reasoner."""
@@ -172,7 +207,7 @@ class OntoManager(QObject):
         try:
             if len(name.strip()) == 0:
                 return "Invalid name"
-            if cls not in ["RackLocation", "Item", "Order"]:
+            if cls not in BASE_CLASSES:
                 return "Invalid class type"
 
             if len(conditions.strip()) != 0:
@@ -180,7 +215,7 @@ class OntoManager(QObject):
             else:
                 full_condition = f"[{cls}]"
             # Test validity of conditions
-            eval(full_condition)
+            eval(compile_condition(full_condition))
             return None
         except Exception as e:  # skipcq: PYL-W0703
             return str(e)
@@ -202,9 +237,24 @@ class OntoManager(QObject):
 
         with onto:
             new_class = type(
-                name, (eval(cls),), {"equivalent_to": eval(full_condition)}
+                name,
+                (BASE_CLASSES[cls],),
+                {"equivalent_to": eval(compile_condition(full_condition))},
             )
 
+        self._pending_classes[name] = (new_class, cls)
+        self.reasoningChanged.emit()
+        if not self._deferred_reasoning:
+            self.apply_reasoning()
+
+    @Slot()
+    def apply_reasoning(self):
+        """Run single reasoning for all pending classes and register them."""
+        if not self._pending_classes:
+            return
+        classes = self._pending_classes
+        self._pending_classes = {}
+
         tmp_file = tempfile.NamedTemporaryFile()
         p = Process(target=sync, args=(tmp_file.name, owlready2.JAVA_EXE))
         p.start()
@@ -222,8 +272,9 @@ class OntoManager(QObject):
         def callback(is_finished):
             """Save output of the thread."""
             if is_finished:
-                self._classes[name] = (new_class, cls)
+                self._classes.update(classes)
                 self.objectsChanged.emit()
+            self.reasoningChanged.emit()
             self.progress_value = 1
 
         self.progress_value = 0
@@ -234,10 +285,7 @@ class OntoManager(QObject):
     @staticmethod
     def _construct_query(cls, query):
         """Construct SPARQL query based on RackLocation, Item or Order."""
-        i1 = "PREFIX : <http://warehouse/onto.owl#>\n"
-        i2 = "SELECT DISTINCT ?obj WHERE {\n"
-        i3 = f"\n?obj a :{cls} . \n"
-        return i1 + i2 + query + i3 + " }"
+        return _QUERY_HEAD + query + _QUERY_TAILS[cls]
 
     @Slot(str, str, str, result=str)
     def check_create_query(self, name, cls, query):
@@ -251,7 +299,7 @@ class OntoManager(QObject):
         try:
             if len(name.strip()) == 0:
                 return "Invalid name"
-            if cls not in ["RackLocation", "Item", "Order"]:
+            if cls not in BASE_CLASSES:
                 return "Invalid class type"
             # Test validity of query
             prepareQuery(self._construct_query(cls, query))
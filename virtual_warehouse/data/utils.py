@@ -27,6 +27,17 @@ types = {
 }
 
 
+def _case_lookup(factors):
+    """Build lookup table containing both lower and upper case variants of units."""
+    lookup = dict(factors)
+    lookup.update({k.upper(): v for k, v in factors.items()})
+    return lookup
+
+
+_dim_lookup = _case_lookup(dim_factors)
+_weight_lookup = _case_lookup(weight_factors)
+
+
 def estimate_sheet_type(sheet):
     """Estimate sheet type based on sheet name."""
     sheet = sheet.lower()
@@ -48,18 +59,44 @@ def convert_type(type_str):
     return types.get(" ".join(type_str.lower().split()), "custom")
 
 
-def convert_dim(dim, uom):
-    """Convert dimension size to meters."""
-    if uom:
-        return dim * dim_factors[uom.lower()]
-    return dim
+def convert_dims(dims, uom):
+    """Convert multiple dimension sizes sharing same unit of measure to meters."""
+    try:
+        factor = _dim_lookup[uom]
+    except KeyError:
+        if not uom:
+            return list(dims)
+        factor = dim_factors[uom.lower()]
+    return [d * factor for d in dims]
 
 
 def convert_weight(weight, uom):
     """Convert weight to kilograms."""
-    if uom:
-        return weight * weight_factors[uom.lower()]
-    return weight
+    try:
+        return weight * _weight_lookup[uom]
+    except KeyError:
+        return weight * weight_factors[uom.lower()] if uom else weight
+
+
+# Parsed dates by (date, fmt), sheets repeat just a few distinct dates
+_date_cache = {}
+# Fast date parsing accepts only ASCII digits (same as strptime)
+_ascii_digits = frozenset("0123456789")
+
+
+def _parse_date(date, fmt):
+    """Parse string date, dates in default format skip the strptime machinery."""
+    if fmt == "%d.%m.%Y":
+        parts = date.split(".")
+        if (
+            len(parts) == 3
+            and 0 < len(parts[0]) <= 2
+            and 0 < len(parts[1]) <= 2
+            and len(parts[2]) == 4
+            and all(_ascii_digits.issuperset(p) for p in parts)
+        ):
+            return datetime(int(parts[2]), int(parts[1]), int(parts[0]))
+    return datetime.strptime(date, fmt)
 
 
 def convert_date(date, fmt="%d.%m.%Y"):
@@ -67,5 +104,9 @@ def convert_date(date, fmt="%d.%m.%Y"):
     if type(date) is datetime:
         return date
     if date:
-        return datetime.strptime(date, fmt)
+        key = (date, fmt)
+        value = _date_cache.get(key)
+        if value is None:
+            value = _date_cache[key] = _parse_date(date, fmt)
+        return value
     return None
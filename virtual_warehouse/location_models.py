@@ -1,3 +1,5 @@
+from operator import itemgetter
+
 from PySide2.QtCore import (
     Property,
     QAbstractListModel,
@@ -11,6 +13,24 @@ from PySide2.QtCore import (
 from virtual_warehouse.environment import LOCATION_TYPE_MAP
 
 
+def _location_dict(location):
+    """Create dictionary representing the location for QML views."""
+    ltype_map = LOCATION_TYPE_MAP[location.has_ltype]
+    return {
+        "name": location.name,
+        "type": location.has_ltype,
+        "mesh_file": ltype_map["mesh"],
+        "color": ltype_map["color"],
+        "gray_color": ltype_map["gray_color"],
+        "x": location.has_x,
+        "y": location.has_y,
+        "z": location.has_z,
+        "length": location.has_length,
+        "width": location.has_width,
+        "height": location.has_height,
+    }
+
+
 class SingleLocation(QObject):
     """Class representing single location in warehouse."""
 
@@ -21,30 +41,19 @@ class SingleLocation(QObject):
             location (Location): location object to represent
         """
         self._i = location
-        self._color = LOCATION_TYPE_MAP[self._i.has_ltype]["color"]
-        self._gcolor = LOCATION_TYPE_MAP[self._i.has_ltype]["gray_color"]
-        self._mesh_file = LOCATION_TYPE_MAP[self._i.has_ltype]["mesh"]
+        self._ltype = self._i.has_ltype
+        # Location attributes are static, dictionary is created only once
+        self._dict = _location_dict(self._i)
+        self.max_z = self._i.has_z
         # Required for displaying selected locations
         self.names = [self._i.name]
 
     def get_dict(self):
         """Return dictionary representing the location."""
-        return {
-            "name": self._i.name,
-            "type": self._i.has_ltype,
-            "mesh_file": self._mesh_file,
-            "color": self._color,
-            "gray_color": self._gcolor,
-            "x": self._i.has_x,
-            "y": self._i.has_y,
-            "z": self._i.has_z,
-            "length": self._i.has_length,
-            "width": self._i.has_width,
-            "height": self._i.has_height,
-        }
-
-    def get_heat(self):
-        """Get heat of location."""
+        return self._dict
+
+    def get_heat(self, level=-1):
+        """Get heat of location (level is ignored, single location has one level)."""
         return self._i.has_freq
 
 
@@ -59,27 +68,16 @@ class MultiLocation(QObject):
         """
         self._l = locations
         self._i = locations[0]
-        self._color = LOCATION_TYPE_MAP[self._i.has_ltype]["color"]
-        self._gcolor = LOCATION_TYPE_MAP[self._i.has_ltype]["gray_color"]
-        self._mesh_file = LOCATION_TYPE_MAP[self._i.has_ltype]["mesh"]
+        self._ltype = self._i.has_ltype
+        # Location attributes are static, dictionary is created only once
+        self._dict = _location_dict(self._i)
+        self.max_z = max(i.has_z for i in locations)
         # Required for displaying selected locations
         self.names = [i.name for i in locations]
 
     def get_dict(self):
         """Return dictionary representing the multi-location."""
-        return {
-            "name": self._i.name,
-            "type": self._i.has_ltype,
-            "mesh_file": self._mesh_file,
-            "color": self._color,
-            "gray_color": self._gcolor,
-            "x": self._i.has_x,
-            "y": self._i.has_y,
-            "z": self._i.has_z,
-            "length": self._i.has_length,
-            "width": self._i.has_width,
-            "height": self._i.has_height,
-        }
+        return self._dict
 
     def get_heat(self, level=-1):
         """Calculate heat of the whole location or single level."""
@@ -107,19 +105,27 @@ class UniversalLocationListModel(QAbstractListModel):
         """Set new objects which should already by wrapped by location class."""
         self._objects = objects
         self._keys = list(objects.keys())
+        self._heats = None
         self.name_to_idx = {}
         for i, k in enumerate(self._keys):
             for n in self._objects[k].names:
                 self.name_to_idx[n] = i
 
         if objects:
-            self._max_level = max(l._i.has_z for l in self._objects.values())
+            self._max_level = max(l.max_z for l in self._objects.values())
             self.maxChanged.emit()
 
     def get_idx(self, idx):
         """Get object by index."""
         return self._objects[self._keys[idx]]
 
+    def idxs_for(self, names):
+        """Get list of indexes of objects containing locations with given names."""
+        if len(names) > 1:
+            # Bulk lookup runs in C (itemgetter returns tuple for multiple keys)
+            return list(itemgetter(*names)(self.name_to_idx))
+        return [self.name_to_idx[n] for n in names]
+
     @Property(int, constant=False, notify=maxChanged)
     def max_level(self):
         """Get max level possible to select."""
@@ -144,6 +150,7 @@ class UniversalLocationListModel(QAbstractListModel):
     def set_level(self, level):
         """Set level property."""
         self._level = level
+        self._heats = None
         self.levelChanged.emit()
 
     @Slot(int, result=float)
@@ -151,6 +158,25 @@ class UniversalLocationListModel(QAbstractListModel):
         """Get heat of location on given index."""
         return self.get_idx(index).get_heat(self._level)
 
+    @Slot(result="QVariantList")
+    def get_heats(self):
+        """Get heats of all locations ordered by index (zero for non-rack locations).
+
+        Heats are cached until frequencies, level or data change (repaints on
+        selection or hover reuse them).
+        """
+        if self._heats is None:
+            level = self._level
+            self._heats = [
+                o.get_heat(level) if o._ltype == "rack" else 0
+                for o in self._objects.values()
+            ]
+        return self._heats
+
+    def invalidate_heats(self):
+        """Drop cached heats, must be called whenever location frequencies change."""
+        self._heats = None
+
     def data(self, index, role):
         """Return data for given role and index (required method)."""
         if index.isValid() and role == UniversalLocationListModel.ObjectRole:
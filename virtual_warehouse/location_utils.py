@@ -1,4 +1,5 @@
 """Module for working with locations."""
+from collections import defaultdict
 
 
 def cluster_locations(locations: dict) -> dict:
@@ -10,11 +11,9 @@ def cluster_locations(locations: dict) -> dict:
     Returns:
         dict: Dictionary mapping (x, y) coord tuple to list of locations.
     """
-    coord_to_locations = {}
+    coord_to_locations = defaultdict(list)
 
-    for key, loc in locations.items():
-        if not loc.get_2d() in coord_to_locations:
-            coord_to_locations[loc.get_2d()] = []
-        coord_to_locations[loc.get_2d()].append(key)
+    for loc in locations.values():
+        coord_to_locations[loc.get_2d()].append(loc)
 
-    return coord_to_locations
+    return dict(coord_to_locations)
@@ -1,4 +1,6 @@
 """Module providing basic functions for working with warehouse map."""
+from operator import add
+
 from PySide2.QtCore import Property, QObject, Signal
 
 
@@ -32,14 +34,21 @@ class Map(QObject):
         Args:
             locations (dict): dictionary of all locations.
         """
-        self._min_x = min(l.has_x for l in locations.values())
-        self._max_x = max(l.has_x + l.has_width for l in locations.values())
-
-        self._min_y = min(l.has_y for l in locations.values())
-        self._max_y = max(l.has_y + l.has_length for l in locations.values())
-
-        self._min_z = min(l.has_z for l in locations.values())
-        self._max_z = max(l.has_z + l.has_height for l in locations.values())
+        # Load attributes of each location only once (attribute access is costly)
+        xs, ys, zs, widths, lengths, heights = zip(
+            *[
+                (l.has_x, l.has_y, l.has_z, l.has_width, l.has_length, l.has_height)
+                for l in locations.values()
+            ]
+        )
+        self._min_x = min(xs)
+        self._max_x = max(map(add, xs, widths))
+
+        self._min_y = min(ys)
+        self._max_y = max(map(add, ys, lengths))
+
+        self._min_z = min(zs)
+        self._max_z = max(map(add, zs, heights))
 
         self._max = max(self._max_x, self._max_y, self._max_z)
         self._min = max(self._min_x, self._min_y, self._min_z)
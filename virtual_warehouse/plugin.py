@@ -1,10 +1,20 @@
 import importlib
 import pkgutil
 from abc import ABC, abstractmethod
+from collections import deque
 
 from PySide2.QtCore import Property, QObject, Qt, Signal
 
 
+def last_key(dictionary):
+    """Get last inserted key of dictionary without copying all keys into list."""
+    try:
+        return next(reversed(dictionary))
+    except TypeError:
+        # Dictionaries are reversible only since Python 3.8
+        return deque(dictionary, maxlen=1)[0]
+
+
 class BasePlugin(ABC):
     """Base plugin class for calculating frequencies.
     Each plugin must be subclass of this BasePlugin class.
@@ -1,7 +1,7 @@
 """Module with plug-in for calculating selected items frequencies."""
+from collections import defaultdict
 
-from virtual_warehouse.data.data_model import Inventory
-from virtual_warehouse.plugin import BasePlugin
+from virtual_warehouse.plugin import BasePlugin, last_key
 
 
 class Plugin(BasePlugin):
@@ -23,7 +23,20 @@ class Plugin(BasePlugin):
         super().__init__(locations, items, orders, inventory)
         self.inventory = inventory
         self.items = items
-        self.date = list(self.inventory.keys())[-1]
+        self.date = last_key(self.inventory)
+        self.item_invs = Plugin.item_inventories(inventory, self.date)
+
+    @staticmethod
+    def item_inventories(inventory, date):
+        """Create dictionary mapping item to list of (location, on-hand qty) on date."""
+        item_to_invs = defaultdict(list)
+        for loc_inventories in inventory[date].values():
+            for inv in loc_inventories:
+                item_to_invs[inv.has_item.name].append(
+                    (inv.has_location, inv.has_onhand_qty)
+                )
+
+        return item_to_invs
 
     def on_items_update(self, clear, add, ids):
         """Update frequency calculation on items check/uncheck.
@@ -36,10 +49,15 @@ class Plugin(BasePlugin):
         if clear:
             self._clear_frequencies()
 
+        # Accumulate quantities first, locations are updated once at the end
+        freqs = defaultdict(int)
         for item_id in ids:
-            invs = Inventory.get_by_item(self.items[item_id], self.date)
-            for inv in invs:
-                inv.has_location.has_freq += (1 if add else -1) * inv.has_onhand_qty
+            for loc, qty in self.item_invs.get(item_id, ()):
+                freqs[loc] += qty
+
+        sign = 1 if add else -1
+        for loc, qty in freqs.items():
+            loc.has_freq += sign * qty
 
     def _calculate_freq(self, locations, items, orders):
         """Calculate frequency for individual locations based on selected orders."""
@@ -1,6 +1,7 @@
 """Module with plug-in for calculating selected items frequencies."""
+from collections import defaultdict
 
-from virtual_warehouse.plugin import BasePlugin
+from virtual_warehouse.plugin import BasePlugin, last_key
 
 
 class Plugin(BasePlugin):
@@ -22,19 +23,18 @@ class Plugin(BasePlugin):
         super().__init__(locations, items, orders, inventory)
         self.orders = orders
         self.item_locs = Plugin.item_locations(inventory)
-        self.date = list(self.item_locs.keys())[-1]
+        self.date = last_key(self.item_locs)
+        self._order_freqs = {}
 
     @staticmethod
     def item_locations(inventory):
         """Create dictionary mapping (date, item) to list of locations."""
         item_to_loc = {}
         for date, status in inventory.items():
-            item_to_loc[date] = {}
+            date_item_to_loc = item_to_loc[date] = defaultdict(list)
             for loc_inventories in status.values():
                 for inv in loc_inventories:
-                    if inv.has_item.name not in item_to_loc[date]:
-                        item_to_loc[date][inv.has_item.name] = []
-                    item_to_loc[date][inv.has_item.name].append(inv.has_location)
+                    date_item_to_loc[inv.has_item.name].append(inv.has_location)
 
         return item_to_loc
 
@@ -49,10 +49,28 @@ class Plugin(BasePlugin):
         if clear:
             self._clear_frequencies()
 
+        # Accumulate quantities first, locations are updated once at the end
+        freqs = defaultdict(int)
         for order_id in ids:
+            for loc, qty in self._get_order_freqs(order_id).items():
+                freqs[loc] += qty
+
+        sign = 1 if add else -1
+        for loc, qty in freqs.items():
+            loc.has_freq += sign * qty
+
+    def _get_order_freqs(self, order_id):
+        """Get quantities which order adds to each location (cached per order)."""
+        freqs = self._order_freqs.get(order_id)
+        if freqs is None:
+            freqs = defaultdict(int)
+            item_locs = self.item_locs[self.date]
             for ord_item in self.orders[order_id].has_ordered_items:
-                for loc in self.item_locs[self.date][ord_item.has_item.name]:
-                    loc.has_freq += (1 if add else -1) * ord_item.has_total_qty
+                qty = ord_item.has_total_qty
+                for loc in item_locs.get(ord_item.has_item.name, ()):
+                    freqs[loc] += qty
+            self._order_freqs[order_id] = freqs
+        return freqs
 
     def _calculate_freq(self, locations, items, orders):
         """Calculate frequency for individual locations based on selected orders."""
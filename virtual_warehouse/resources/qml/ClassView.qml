@@ -48,6 +48,31 @@ Item {
                 dialogs.openCreateClassDialog()
             }
         }
+
+        ToolButton {
+            id: toolButton4
+            text: qsTr("Defer")
+            anchors.right: toolButton5.visible ? toolButton5.left : parent.right
+            checkable: true
+            checked: ViewController.onto_manager.deferred_reasoning
+
+            onToggled: {
+                ViewController.onto_manager.deferred_reasoning = checked
+            }
+        }
+
+        ToolButton {
+            id: toolButton5
+            text: qsTr("Apply (%1)").arg(ViewController.onto_manager.pending_count)
+            anchors.right: parent.right
+            visible: ViewController.onto_manager.deferred_reasoning
+            enabled: ViewController.onto_manager.java_correct
+                     && ViewController.onto_manager.pending_count > 0
+
+            onClicked: {
+                ViewController.onto_manager.apply_reasoning()
+            }
+        }
     }
 
     Text {
@@ -33,7 +33,7 @@ Canvas {
         var min_y = ViewController.map.min_y
         var params = Utils.getDrawParams(mapView2D.height, mapView2D.width, ViewController)
         var item, heat, max = 1
-        var heats = []
+        var heats = ViewController.model2D.get_heats()
 
         // Draw Floor first
         for (var row = 0; row < ViewController.model2D.rowCount(); row++) {
@@ -46,7 +46,6 @@ Canvas {
                              item.width * params.coef,
                              item.length * params.coef)
             } else if (item.type === "rack") {
-                heats[row] = ViewController.model2D.get_heat(row)
                 max = Math.max(heats[row], max)
             }
         }
@@ -54,6 +53,7 @@ Canvas {
         // Set global max_heat property
         max_heat = max
         var is_heatmap = ViewController.is_heatmap
+        var heat_scale = get_heat_scale(max)
 
         for (row = 0; row < ViewController.model2D.rowCount(); row++) {
             item = ViewController.model2D.get(row)
@@ -63,7 +63,7 @@ Canvas {
                 if (is_heatmap) {
                     // is_heatmap() in future
                     if (item.type === "rack") {
-                        heat = get_heat_color(heats[row], max)
+                        heat = get_scaled_heat_color(heats[row], heat_scale)
                         ctx.fillStyle = heat
                     } else {
                         ctx.fillStyle = item.gray_color
@@ -280,8 +280,7 @@ Canvas {
             Material.theme: Material.Light
             orientation: Qt.Vertical
             snapMode: Slider.SnapAlways
-            // Only model3D correctly set max Z coordinate right now
-            to: ViewController.model3D.max_level
+            to: ViewController.model2D.max_level
             from: 0
             value: -1
             stepSize: 1
@@ -409,9 +408,19 @@ Canvas {
         "#DFE318", "#E1E318", "#E4E318", "#E7E419", "#E9E419", "#ECE41A", "#EEE51B",
         "#F1E51C", "#F3E51E", "#F6E61F", "#F8E621", "#FAE622", "#FDE724"]
 
+    function get_heat_scale(max) {
+        // Coefficient mapping heat values to color indexes
+        return 255 / Math.max(1, max)
+    }
+
+    function get_scaled_heat_color(heat, scale) {
+        // Use value from predefined colors, clamp index (NaN maps to first color)
+        var idx = Math.round(heat * scale)
+        return colors[idx > 0 ? Math.min(255, idx) : 0]
+    }
+
     function get_heat_color(heat, max) {
-        // Use value from predefined colors
-        return colors[Math.min(255, Math.round((heat / Math.max(1, max)) * 255))]
+        return get_scaled_heat_color(heat, get_heat_scale(max))
     }
 }
 
@@ -69,7 +69,7 @@ Item {
             var selected_idxs = ViewController.get_selected()
             for (var i = 0; !splitView.controlKey && i < selected_idxs.length; i++) {
                 var idx = selected_idxs[i]
-                if (idx >= 0) {
+                if (idx >= 0 && idx < surfacePlot.customItemList.length) {
                     surfacePlot.customItemList[idx].textureFile
                             = ":/textures/default.png"
                 }
@@ -87,7 +87,9 @@ Item {
     Connections {
         target: ViewController
 
-        function onModelChanged() {
+        function onModel3DChanged() {
+            // Previous indexes don't belong to new items
+            selectedIdxs = []
             surfacePlot.removeCustomItems()
             for (var row = 0; row < ViewController.model3D.rowCount(); row++) {
                 var item = ViewController.model3D.get(row)
@@ -106,9 +108,14 @@ Item {
         }
 
         function onItemSelected() {// TODO: select items based on 2D map
+            // Selected indexes belong to 2D model (3D model may not be built yet)
+            if (ViewController.is2D()) {
+                return
+            }
+
             for (var i = 0; !splitView.controlKey && i < selectedIdxs.length; i++) {
                 var idx = selectedIdxs[i]
-                if (idx >= 0) {
+                if (idx >= 0 && idx < surfacePlot.customItemList.length) {
                     surfacePlot.customItemList[idx].textureFile
                             = ":/textures/default.png"
                 }
@@ -117,13 +124,13 @@ Item {
             selectedIdxs = ViewController.get_selected()
             for (var i = 0; !splitView.controlKey && i < selectedIdxs.length; i++) {
                 var idx = selectedIdxs[i]
-                if (idx >= 0) {
+                if (idx >= 0 && idx < surfacePlot.customItemList.length) {
                     surfacePlot.customItemList[idx].textureFile
                             = ":/textures/red.png"
                 }
             }
         }
 
-        Component.onCompleted: onModelChanged()
+        Component.onCompleted: onModel3DChanged()
     }
 }
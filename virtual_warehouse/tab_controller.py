@@ -207,19 +207,25 @@ class UniversalListModel(QAbstractListModel):
         self.checked = set()
         self._search_text = ""
         self._filter = 0
-
-        if objects is None:
-            self._objects = {}
-        else:
-            self._objects = {k: self._object_class(v) for k, v in objects.items()}
+        self.set_data({} if objects is None else objects)
 
     # Emits list as [is_clear, is_add, list_of_ids]
     checkChanged = Signal("QVariantList")
     filterChanged = Signal()
 
     def set_data(self, objects):
-        """Set new objects and wrap then in wrapper class."""
-        self._objects = {k: self._object_class(v) for k, v in objects.items()}
+        """Set new objects, they are wrapped in wrapper class on first access."""
+        self._raw_objects = objects
+        self._objects = {}
+
+    def get_object(self, key):
+        """Get object wrapper for given id (wrapper is created when needed)."""
+        wrapper = self._objects.get(key)
+        if wrapper is None:
+            wrapper = self._objects[key] = self._object_class(self._raw_objects[key])
+            if key in self.checked:
+                wrapper.set_checked(True)
+        return wrapper
 
     def set_selected(self, selected, check=False):
         """Set new list of selected objects."""
@@ -236,7 +242,7 @@ class UniversalListModel(QAbstractListModel):
     def data(self, index, role):
         """Return data for given role and index (required method)."""
         if index.isValid() and role == UniversalListModel.ObjectRole:
-            return self._objects[self._selected[index.row()]]
+            return self.get_object(self._selected[index.row()])
         return None
 
     def roleNames(self):  # skipcq: PYL-R0201
@@ -248,7 +254,9 @@ class UniversalListModel(QAbstractListModel):
     def clear_checked(self):
         """Clear all checked items in list."""
         for n in self.checked:
-            self._objects[n].set_checked(False)
+            # Objects without wrapper get checked state on wrapper creation
+            if n in self._objects:
+                self._objects[n].set_checked(False)
         self.checked.clear()
 
     def set_checked(self, checked, control=False):
@@ -264,8 +272,10 @@ class UniversalListModel(QAbstractListModel):
 
         self.checked.update(checked)
         self._update_filter()
-        for n in self.checked:
-            self._objects[n].set_checked(True)
+        # Previously checked objects are already in checked state
+        for n in checked:
+            if n in self._objects:
+                self._objects[n].set_checked(True)
 
         self.checkChanged.emit([not control, True, checked])
 
@@ -308,7 +318,7 @@ class UniversalListModel(QAbstractListModel):
     @Slot(str, bool)
     def check(self, _id, check=True):
         """Check/uncheck one item in the list."""
-        self._objects[_id].set_checked(check)
+        self.get_object(_id).set_checked(check)
         if check:
             self.checked.add(_id)
         else:
@@ -369,26 +379,32 @@ class SideviewListModel(UniversalListModel):
         self._selected_max_heat = 1
         self._hovered_max_heat = 1
         self._is_hovered = False
-
-        if objects is None:
-            self._objects = {}
-        else:
-            self._objects = {k: self._object_class(v) for k, v in objects.items()}
+        self.set_data({} if objects is None else objects)
 
     def set_selected(self, selected, check=False):
         """Set list of names of clicked locations."""
         self._selected = list(reversed(selected))
         if self._selected:
-            self._selected_max_heat = max(self._objects[k].heat for k in self._selected)
+            self._selected_max_heat = max(
+                self.get_object(k).heat for k in self._selected
+            )
             self.maxChanged.emit()
         self.layoutChanged.emit()
 
     def set_hovered(self, hovered, is_hovered=True):
         """Set list of names of currently hovered locations."""
+        was_hovered = self._is_hovered
         self._is_hovered = is_hovered
-        self._hovered = list(reversed(hovered))
-        if self._hovered:
-            self._hovered_max_heat = max(self._objects[k].heat for k in self._hovered)
+        if is_hovered:
+            self._hovered = hovered[::-1]
+            if hovered:
+                # Heat is read from locations, wrappers are created only for drawn rows
+                self._hovered_max_heat = max(
+                    self._raw_objects[k].has_freq for k in hovered
+                )
+                self.maxChanged.emit()
+        elif was_hovered:
+            # Max heat switches back to selected locations
             self.maxChanged.emit()
         self.layoutChanged.emit()
 
@@ -401,7 +417,9 @@ class SideviewListModel(UniversalListModel):
     def update(self):
         """Update maximal value, emit maxChanged signal which results in list redraw."""
         if self._selected:
-            self._selected_max_heat = max(self._objects[k].heat for k in self._selected)
+            self._selected_max_heat = max(
+                self.get_object(k).heat for k in self._selected
+            )
             self.maxChanged.emit()
 
     def rowCount(self, parent=QModelIndex()):
@@ -414,6 +432,6 @@ class SideviewListModel(UniversalListModel):
         """Return data for given role and index (required method)."""
         if index.isValid() and role == UniversalListModel.ObjectRole:
             if self._is_hovered:
-                return self._objects[self._hovered[index.row()]]
-            return self._objects[self._selected[index.row()]]
+                return self.get_object(self._hovered[index.row()])
+            return self.get_object(self._selected[index.row()])
         return None
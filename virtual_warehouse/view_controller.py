@@ -1,5 +1,16 @@
 """Module providing ViewController class - connector class between QML and Python."""
-from PySide2.QtCore import Property, QObject, Qt, QThread, QUrl, Signal, Slot
+from collections import Counter
+
+from PySide2.QtCore import (
+    Property,
+    QObject,
+    Qt,
+    QThread,
+    QTimer,
+    QUrl,
+    Signal,
+    Slot,
+)
 
 from virtual_warehouse.data.agent_parser import AgentManager
 from virtual_warehouse.data.data_model import (
@@ -8,6 +19,7 @@ from virtual_warehouse.data.data_model import (
     Location,
     Order,
     RackLocation,
+    batch_insert,
     save_ontology,
 )
 from virtual_warehouse.data.excel_parser import Document
@@ -32,7 +44,7 @@ from virtual_warehouse.tab_controller import (
 class DataLoaderThread(QThread):
     """Thread which loads warehouse data from file."""
 
-    locationsReady = Signal(object)
+    locationsReady = Signal(object, object)
     itemsReady = Signal(object)
     inventoryReady = Signal(object)
     ordersReady = Signal(object)
@@ -78,69 +90,47 @@ class DataLoaderThread(QThread):
 
         document = Document(self.file_path)
 
-        if (
-            len(where(self.sheets, "Locations")) > 0
-            and len(where(self.sheets, "Coordinates")) > 0
-        ):
-            Location.destroy_all()
-            for sheet in where(self.sheets, "Locations"):
-                self.locations = document.parse_locations(sheet)
-
-            for sheet in where(self.sheets, "Coordinates"):
-                self.locations = document.parse_coordinates(sheet)
+        with batch_insert():
+            if (
+                len(where(self.sheets, "Locations")) > 0
+                and len(where(self.sheets, "Coordinates")) > 0
+            ):
+                Location.destroy_all()
+                for sheet in where(self.sheets, "Locations"):
+                    self.locations = document.parse_locations(sheet)
 
-            self.locationsReady.emit(self.locations)
+                for sheet in where(self.sheets, "Coordinates"):
+                    self.locations = document.parse_coordinates(sheet)
 
-        if len(where(self.sheets, "Items")) > 0:
-            Item.destroy_all()
-            for sheet in where(self.sheets, "Items"):
-                self.items = document.parse_items(sheet)
+                # Clustering is pure Python work, keep it out of the GUI thread
+                clusters = cluster_locations(self.locations)
+                self.locationsReady.emit(self.locations, clusters)
 
-            self.itemsReady.emit(self.items)
+            if len(where(self.sheets, "Items")) > 0:
+                Item.destroy_all()
+                for sheet in where(self.sheets, "Items"):
+                    self.items = document.parse_items(sheet)
 
-        if len(where(self.sheets, "Inventory")) > 0:
-            Inventory.destroy_all()
-            for sheet in where(self.sheets, "Inventory"):
-                self.inventory = document.parse_inventory_balance(sheet)
+                self.itemsReady.emit(self.items)
 
-            self.inventoryReady.emit(self.inventory)
+            if len(where(self.sheets, "Inventory")) > 0:
+                Inventory.destroy_all()
+                for sheet in where(self.sheets, "Inventory"):
+                    self.inventory = document.parse_inventory_balance(sheet)
 
-        if len(where(self.sheets, "Orders")) > 0:
-            Order.destroy_all()
-            for sheet in where(self.sheets, "Orders"):
-                self.orders = document.parse_orders(sheet)
+                self.inventoryReady.emit(self.inventory)
 
-            self.ordersReady.emit(self.orders)
+            if len(where(self.sheets, "Orders")) > 0:
+                Order.destroy_all()
+                for sheet in where(self.sheets, "Orders"):
+                    self.orders = document.parse_orders(sheet)
 
-        # First query is always slower than rest (probably some initialization going on)
-        Item.get_by_locations([self.locations[next(iter(self.locations))]])
+                self.ordersReady.emit(self.orders)
 
         self.frequenciesReady.emit()
         document.close()
 
 
-class QueryThread(QThread):
-    """Thread runs database queries."""
-
-    dataReady = Signal(object)
-
-    def __init__(self, function, *args):
-        """Initialize thread params for running the query.
-
-        Args:
-            function (Callable): function which runs the query.
-            *args: arguments which will be passed to the function
-        """
-        super(QueryThread, self).__init__()
-        self.function = function
-        self.args = args
-
-    def run(self):
-        """Run the query and emit data through dataReady signal."""
-        data = self.function(*self.args)
-        self.dataReady.emit(data)
-
-
 class ViewController(QObject):
     """Main controller which communicates with QML GUI and controls all components."""
 
@@ -153,6 +143,10 @@ class ViewController(QObject):
 
         self._model3D = UniversalLocationListModel(on_change=self.modelChanged.emit)
         self._model2D = UniversalLocationListModel(on_change=self.modelChanged.emit)
+        # Model of current view, updated on view switch (used by frequent slots)
+        self._active_model = self._model2D
+        # 3D model is filled on first switch to 3D view
+        self._model3D_pending = False
         self._map = Map()
 
         self._sideview_model = SideviewListModel(TabLocation)
@@ -171,20 +165,28 @@ class ViewController(QObject):
             self.drawModeChanged,
         )
         self._onto_manager = OntoManager()
+        # Connected before QML handlers, heats are recalculated on next repaint
+        self.drawModeChanged.connect(self._model2D.invalidate_heats)
 
-        self.selected_idxs = {}
+        # Counter of selected locations for each index (2D indexes merge locations)
+        self.selected_idxs = Counter()
         self._hovered_idx = -1
+        # Selection updates are coalesced into one signal per event loop pass
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(0)
+        self._selection_timer.timeout.connect(self.itemSelected.emit)
 
         self.locations = None
         self.items = None
         self.inventory = None
         self.orders = None
 
-        self._query_thread = None
         self._loader = None
         self._progress_value = 1
 
     modelChanged = Signal()
+    model3DChanged = Signal()
     sideviewChanged = Signal()
     drawModeChanged = Signal()
     itemSelected = Signal()
@@ -198,14 +200,14 @@ class ViewController(QObject):
     @Property(QObject, constant=False, notify=modelChanged)
     def model(self):
         """Get current model 2D or 3D depending on selection."""
-        return self._model2D if self._is2D else self._model3D
+        return self._active_model
 
     @Property(QObject, constant=False, notify=modelChanged)
     def model2D(self):
         """List model with list of 2D locations."""
         return self._model2D
 
-    @Property(QObject, constant=False, notify=modelChanged)
+    @Property(QObject, constant=False, notify=model3DChanged)
     def model3D(self):
         """List model with list of 3D locations."""
         return self._model3D
@@ -276,11 +278,14 @@ class ViewController(QObject):
     def switch_view(self):
         """Switch 2D - 3D model and update selection."""
         self._is2D = not self._is2D
+        self._active_model = self._model2D if self._is2D else self._model3D
+        if not self._is2D and self._model3D_pending:
+            self._set_model3D_data()
         self.selected_idxs.clear()
-        for name in self._location_model.checked:
-            idx = self.model.name_to_idx[name]
-            self.selected_idxs[idx] = self.selected_idxs.get(idx, 0) + 1
-        self.itemSelected.emit()
+        self.selected_idxs.update(
+            self._active_model.idxs_for(self._location_model.checked)
+        )
+        self._selection_timer.start()
 
     def _select_locations(self, selected, checked, clear):
         """Update selected locations in the map.
@@ -293,16 +298,17 @@ class ViewController(QObject):
         if clear:
             self.selected_idxs.clear()
 
-        for name in selected:
-            idx = self.model.name_to_idx[name]
-            # Add or remove one occurrence of locations from counter
-            self.selected_idxs[idx] = self.selected_idxs.get(idx, 0) + (
-                1 if checked else -1
-            )
-            if self.selected_idxs[idx] <= 0:
-                self.selected_idxs.pop(idx)
+        idxs = self._active_model.idxs_for(selected)
+        # Add or remove one occurrence of locations from counter
+        if checked:
+            self.selected_idxs.update(idxs)
+        else:
+            self.selected_idxs.subtract(idxs)
+            for idx in set(idxs):
+                if self.selected_idxs[idx] <= 0:
+                    del self.selected_idxs[idx]
 
-        self.itemSelected.emit()
+        self._selection_timer.start()
 
     @Slot(str, bool)
     def select_location(self, selected, checked):
@@ -317,21 +323,23 @@ class ViewController(QObject):
     @Slot(int, bool)
     def select_map_location(self, idx, control=False):
         """Update selected location from map (CTRL adds location)."""
+        location_model = self._location_model
+        sideview_model = self._sideview_model
         if not control:
             self.selected_idxs.clear()
 
         if idx >= 0:
-            names = self.model.get_idx(idx).names
+            names = self._active_model.get_idx(idx).names
             self.selected_idxs[idx] = len(names)
-            self._location_model.set_checked(names, control)
+            location_model.set_checked(names, control)
             if self._is2D:
-                self._sideview_model.set_selected(names)
+                sideview_model.set_selected(names)
             else:
-                self._sideview_model.set_selected([])
-        elif self._location_model.rowCount():
-            self._location_model.set_checked([])
-            self._sideview_model.set_selected([])
-        self.itemSelected.emit()
+                sideview_model.set_selected([])
+        elif location_model.rowCount():
+            location_model.set_checked([])
+            sideview_model.set_selected([])
+        self._selection_timer.start()
 
     @Slot(bool)
     def select_all(self, select):
@@ -360,22 +368,16 @@ class ViewController(QObject):
 
     # Connecting sidebar tabs
     def _connect_tabs(self, src_tab_model, dst_tab_model, connector, locations=False):
-        """Run query and update tab model with resulting data."""
+        """Get related objects and update tab model with resulting data.
 
-        def callback(data):
-            """Process data from query (callback function)."""
-            names = [i[0].name for i in data]
+        Connectors use in-memory relation indexes, so they run directly in GUI thread.
+        """
+        if src_tab_model.checked:
+            objs = [src_tab_model._raw_objects[k] for k in src_tab_model.checked]
+            names = [i.name for i in connector(objs)]
             dst_tab_model.set_checked(names)
-            self._query_thread = None
             if locations:
                 self._select_locations(names, checked=True, clear=True)
-
-        if src_tab_model.checked:
-            objs = [src_tab_model._objects[k]._i for k in src_tab_model.checked]
-            if self._query_thread is None:
-                self._query_thread = QueryThread(connector, objs)
-                self._query_thread.dataReady.connect(callback, Qt.QueuedConnection)
-                self._query_thread.start()
         else:
             dst_tab_model.set_checked([])
 
@@ -423,7 +425,7 @@ class ViewController(QObject):
         if idx != self._hovered_idx:
             self._hovered_idx = idx
             if idx >= 0:
-                names = self.model.get_idx(idx).names
+                names = self._active_model.get_idx(idx).names
                 self._sideview_model.set_hovered(names, True)
             else:
                 self._sideview_model.set_hovered([], False)
@@ -487,8 +489,8 @@ class ViewController(QObject):
         )
         self._loader.start()
 
-    def _load_locations(self, locations):
-        """Process loaded locations (callback function)."""
+    def _load_locations(self, locations, clusters):
+        """Process loaded locations and their 2D clusters (callback function)."""
         self.selected_idxs.clear()
         self.locations = locations
 
@@ -497,24 +499,33 @@ class ViewController(QObject):
         self._location_model.clear_checked()
         self._location_model.set_data(locations)
         self._location_model.set_selected(
-            [k for k, v in locations.items() if v.has_ltype == "rack"]
+            # Parser creates RackLocation exactly for locations of "rack" type
+            [k for k, v in locations.items() if isinstance(v, RackLocation)]
         )
 
         self._sideview_model.set_data(locations)
 
-        self._model3D.set_data(
-            {k: SingleLocation(v) for k, v in self.locations.items()}
-        )
+        if self._is2D:
+            self._model3D_pending = True
+            self._model3D.set_data({})
+            self.model3DChanged.emit()
+        else:
+            self._set_model3D_data()
 
-        clusters = cluster_locations(self.locations)
-        multi_loc = {}
-        for k, v in clusters.items():
-            multi_loc[k] = MultiLocation([self.locations[l] for l in v])
-        self._model2D.set_data(multi_loc)
+        self._model2D.set_data({k: MultiLocation(v) for k, v in clusters.items()})
 
         self.modelChanged.emit()
         self.progress_value = 0.3
 
+    def _set_model3D_data(self):
+        """Fill 3D model with wrapped locations."""
+        locations = self.locations
+        self._model3D.set_data(
+            dict(zip(locations.keys(), map(SingleLocation, locations.values())))
+        )
+        self._model3D_pending = False
+        self.model3DChanged.emit()
+
     def _load_items(self, items):
         """Process loaded items (callback function)."""
         self.items = items